@@ -6,7 +6,6 @@ import importlib
 import inspect
 import json
 import os
-import pdb
 import pickle
 import re
 import subprocess
@@ -1562,6 +1561,8 @@ class RedunClient:
 
         except Exception:
             if args.pdb:
+                import pdb
+
                 # Start postmortem debugger.
                 print("Uncaught exception. Entering postmortem debugging.")
                 tb = sys.exc_info()[2]
@@ -2915,7 +2916,8 @@ class RedunClient:
             job_ids = [job["jobId"] for job in executor.get_jobs(statuses=statuses)]
             for job_id in job_ids:
                 self.display("Killing job {}...".format(job_id))
-                executor.kill_jobs([job_id])
+            # kill_jobs() is lazy, so consume it to send the terminate requests.
+            list(executor.kill_jobs(job_ids))
 
     def aws_logs_command(self, args: Namespace, extra_args: List[str], argv: List[str]) -> None:
         """
@@ -8,12 +8,25 @@ import subprocess
 import threading
 import time
 import uuid
-from collections import OrderedDict, defaultdict
-from functools import lru_cache
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from itertools import islice
 from shlex import quote
-from tempfile import mkstemp
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 from urllib.error import URLError
 from urllib.request import urlopen
 
@@ -22,11 +35,11 @@ import boto3
 from redun.executors import aws_utils
 from redun.executors.base import Executor, register_executor
 from redun.file import File
-from redun.job_array import AWS_ARRAY_VAR, JobArrayer
+from redun.job_array import AWS_ARRAY_VAR, JobArrayer, PendingJob
 from redun.scheduler import Job, Scheduler, Traceback
 from redun.scripting import ScriptError, get_task_command
 from redun.task import Task
-from redun.utils import get_import_paths, pickle_dump
+from redun.utils import get_import_paths, pickle_dumps
 
 SUBMITTED = "SUBMITTED"
 PENDING = "PENDING"
@@ -47,11 +60,48 @@ BATCH_JOB_STATUSES = aws_utils.JobStatus(
     timeout=[],
 )
 
+# Details of a failed Batch job: (can_override, container_reason, (error, error_traceback)).
+JobFailure = Tuple[bool, str, Optional[Tuple[Exception, Traceback]]]
+
+T = TypeVar("T")
+S = TypeVar("S")
+
 
 BATCH_LOG_GROUP = "/aws/batch/job"
+# The AWS Batch API can only describe up to 100 jobs at a time.
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+# Factor by which the monitor interval grows while no jobs are finishing.
+MONITOR_BACKOFF_FACTOR = 1.5
+# Maximum number of failed jobs whose CloudWatch logs are fetched at once, since
+# GetLogEvents has a low per-account rate limit.
+MAX_CONCURRENT_LOG_FETCHES = 4
+# Maximum number of events CloudWatch returns per get_log_events call.
+MAX_LOG_EVENTS_LIMIT = 10000
 ARRAY_JOB_SUFFIX = "array"
+ARRAY_JOB_NAME_SUFFIX = f"-{ARRAY_JOB_SUFFIX}"
 DOCKER_INSPECT_ERROR = "CannotInspectContainerError: Could not transition to inspecting"
 BATCH_JOB_TIMEOUT_ERROR = "Job attempt duration exceeded timeout"
+JOB_NAME_HASH_PATTERN = re.compile(".*-(?P<hash>[^-]+)")
+
+# Shell script run by AWS Batch jobs for script tasks. It fetches the task
+# command from S3, runs it, and uploads its stdout, stderr, and status.
+SCRIPT_COMMAND_TEMPLATE = """
+aws s3 cp {input_path} .task_command
+chmod +x .task_command
+(
+  ./.task_command \
+  2> >(tee .task_error >&2) | tee .task_output
+) && (
+    aws s3 cp .task_output {output_path}
+    aws s3 cp .task_error {error_path}
+    echo ok | aws s3 cp - {status_path}
+) || (
+    [ -f .task_output ] && aws s3 cp .task_output {output_path}
+    [ -f .task_error ] && aws s3 cp .task_error {error_path}
+    echo fail | aws s3 cp - {status_path}
+    {exit_command}
+)
+"""
 
 
 def get_default_registry() -> str:
@@ -96,7 +146,7 @@ def ecr_push(repo_name: str, registry: Optional[str] = None) -> None:
 
 
 def is_array_job_name(job_name: str) -> bool:
-    return job_name.endswith(f"-{ARRAY_JOB_SUFFIX}")
+    return job_name.endswith(ARRAY_JOB_NAME_SUFFIX)
 
 
 @lru_cache(maxsize=200)
@@ -261,11 +311,13 @@ def batch_submit(
     return batch_run
 
 
+@lru_cache(maxsize=1)
 def is_ec2_instance() -> bool:
     """
     Returns True if this process is running on an EC2 instance.
 
     We use the presence of a link-local address as a sign we are on an EC2 instance.
+    The result is cached, since the probe can take up to a second.
     """
     try:
         resp = urlopen("http://169.254.169.254/latest/meta-data/", timeout=1)
@@ -274,6 +326,17 @@ def is_ec2_instance() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def get_aws_credentials() -> Any:
+    """
+    Returns the AWS credentials of the default session.
+
+    The credential provider chain is only walked once. The returned object
+    refreshes itself when needed, so callers should freeze it at each use.
+    """
+    return boto3.Session().get_credentials()
+
+
 def run_docker(
     command: List[str],
     image: str,
@@ -292,8 +355,7 @@ def run_docker(
     # Add AWS credentials to environment for docker command.
     env = dict(os.environ)
     if not is_ec2_instance():
-        session = boto3.Session()
-        creds = session.get_credentials().get_frozen_credentials()
+        creds = get_aws_credentials().get_frozen_credentials()
         cred_map = {
             "AWS_ACCESS_KEY_ID": creds.access_key,
             "AWS_SECRET_ACCESS_KEY": creds.secret_key,
@@ -340,16 +402,11 @@ def run_docker(
         # resets the tty settings.
         env["NORAW"] = "true"
 
-        # Run Docker interactively.
-        fd, cidfile = mkstemp()
-        os.close(fd)
-        os.remove(cidfile)
-
-        docker_command = ["docker", "run", "-it", "--cidfile", cidfile] + common_args
-        subprocess.check_call(docker_command, env=env)
-        with open(cidfile) as infile:
-            container_id = infile.read().strip()
-        os.remove(cidfile)
+        # Run Docker interactively. Creating the container first gives us its id
+        # directly, and then we attach to it while it runs.
+        docker_command = ["docker", "create", "-it"] + common_args
+        container_id = subprocess.check_output(docker_command, env=env).strip().decode("utf8")
+        subprocess.check_call(["docker", "start", "-ai", container_id], env=env)
     else:
         # Run Docker in the background.
         docker_command = ["docker", "run", "-d"] + common_args
@@ -362,7 +419,7 @@ def get_batch_job_name(prefix: str, job_hash: str, array: bool = False) -> str:
     """
     Return a AWS Batch Job name by either job or job hash.
     """
-    return "{}-{}{}".format(prefix, job_hash, f"-{ARRAY_JOB_SUFFIX}" if array else "")
+    return "{}-{}{}".format(prefix, job_hash, ARRAY_JOB_NAME_SUFFIX if array else "")
 
 
 def get_hash_from_job_name(job_name: str) -> Optional[str]:
@@ -371,9 +428,8 @@ def get_hash_from_job_name(job_name: str) -> Optional[str]:
     on Batch.
     """
     # Remove array job suffix, if present.
-    array_suffix = "-" + ARRAY_JOB_SUFFIX
-    if job_name.endswith(array_suffix):
-        job_name = job_name[: -len(array_suffix)]
+    if job_name.endswith(ARRAY_JOB_NAME_SUFFIX):
+        job_name = job_name[: -len(ARRAY_JOB_NAME_SUFFIX)]
 
     # It's possible we found jobs that are unrelated to the this work based off the job_name_prefix
     # matching when fetching in get_jobs. These jobs will not have hashes so we can ignore them.
@@ -384,7 +440,7 @@ def get_hash_from_job_name(job_name: str) -> Optional[str]:
     # where a headnode job is running but has no hash so we don't want to interact with that job
     # here. If we don't find a match, consider this a case of the above where we matched unrelated
     # jobs and return None to let callers know this is the case.
-    match = re.match(".*-(?P<hash>[^-]+)", job_name)
+    match = JOB_NAME_HASH_PATTERN.match(job_name)
     if match:
         return match["hash"]
 
@@ -419,6 +475,20 @@ def get_docker_job_options(job_options: dict) -> dict:
     return {key: job_options[key] for key in keys if key in job_options}
 
 
+@lru_cache(maxsize=20)
+def get_import_args(import_paths: Tuple[str, ...], base_path: str) -> Tuple[str, ...]:
+    """
+    Returns the `--import-path` arguments for python import paths.
+
+    Results are cached, since import paths rarely change between job submissions.
+    """
+    import_args: List[str] = []
+    for abs_path in import_paths:
+        # Use relative paths so that they work inside the docker container.
+        import_args.extend(["--import-path", os.path.relpath(abs_path, base_path)])
+    return tuple(import_args)
+
+
 def submit_task(
     image: str,
     queue: str,
@@ -433,48 +503,33 @@ def submit_task(
     debug: bool = False,
     code_file: Optional[File] = None,
     aws_region: str = aws_utils.DEFAULT_AWS_REGION,
+    input_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Submit a redun Task to AWS Batch or Docker (debug=True).
+
+    If `input_path` is given for a non-array job, it is used as an already
+    uploaded input file instead of serializing `args` and `kwargs`.
     """
     if array_size:
         # Output_path will contain a pickled list of actual output paths, etc.
         # Want files that won't get clobbered when jobs actually run
         assert array_uuid
-        input_path = aws_utils.get_array_scratch_file(
-            s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_INPUT
-        )
-        output_path = aws_utils.get_array_scratch_file(
-            s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_OUTPUT
-        )
-        error_path = aws_utils.get_array_scratch_file(
-            s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_ERROR
+        input_path, output_path, error_path, _ = aws_utils.get_array_scratch_paths(
+            s3_scratch_prefix, array_uuid
         )
     else:
-        input_path = aws_utils.get_job_scratch_file(
-            s3_scratch_prefix, job, aws_utils.S3_SCRATCH_INPUT
-        )
-        output_path = aws_utils.get_job_scratch_file(
-            s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-        )
-        error_path = aws_utils.get_job_scratch_file(
-            s3_scratch_prefix, job, aws_utils.S3_SCRATCH_ERROR
-        )
+        scratch_paths = aws_utils.get_job_scratch_paths(s3_scratch_prefix, job)
+        output_path, error_path = scratch_paths.output, scratch_paths.error
 
-        # Serialize arguments to input file.
-        # Array jobs set this up earlier, in `_submit_array_job`
-        input_file = File(input_path)
-        with input_file.open("wb") as out:
-            pickle_dump([args, kwargs], out)
+        if not input_path:
+            # Serialize arguments to input file.
+            # Array jobs set this up earlier, in `_submit_array_job`
+            input_path = scratch_paths.input
+            File(input_path).write(pickle_dumps([args, kwargs]), mode="wb")
 
     # Determine additional python import paths.
-    import_args = []
-    base_path = os.getcwd()
-    for abs_path in get_import_paths():
-        # Use relative paths so that they work inside the docker container.
-        rel_path = os.path.relpath(abs_path, base_path)
-        import_args.append("--import-path")
-        import_args.append(rel_path)
+    import_args = list(get_import_args(tuple(get_import_paths()), os.getcwd()))
 
     # Build job command.
     code_arg = ["--code", code_file.path] if code_file else []
@@ -519,19 +574,24 @@ def submit_task(
         )
     else:
         # Submit to local Docker.
-        # This loop only runs if array_size > 0
-        result = {"jobId": [], "redun_job_id": []}
-        for i in range(array_size):
-            container_id = run_docker(
-                command, image=image, array_index=i, **get_docker_job_options(job_options)
-            )
-            result["jobId"].append(container_id)
-            result["redun_job_id"].append(job.id)
-
-        # Otherwise, submit one non-array job
+        docker_options = get_docker_job_options(job_options)
         if not array_size:
-            container_id = run_docker(command, image=image, **get_docker_job_options(job_options))
+            # Submit one non-array job.
+            container_id = run_docker(command, image=image, **docker_options)
             result = {"jobId": container_id, "redun_job_id": job.id}
+        else:
+            # Submit one container per array index.
+            # Positional argument is the array index.
+            run_array_docker = partial(run_docker, command, image, **docker_options)
+            if docker_options.get("interactive", True):
+                # Interactive containers share the terminal, so run them one at a time.
+                container_ids = list(map(run_array_docker, range(array_size)))
+            else:
+                # Background containers can be launched concurrently.
+                max_workers = min(array_size, 4 * (os.cpu_count() or 1))
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    container_ids = list(pool.map(run_array_docker, range(array_size)))
+            result = {"jobId": container_ids, "redun_job_id": [job.id] * array_size}
     return result
 
 
@@ -548,13 +608,8 @@ def submit_command(
     """
     Submit a shell command to AWS Batch or Docker (debug=True).
     """
-    input_path = aws_utils.get_job_scratch_file(s3_scratch_prefix, job, aws_utils.S3_SCRATCH_INPUT)
-    output_path = aws_utils.get_job_scratch_file(
-        s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-    )
-    error_path = aws_utils.get_job_scratch_file(s3_scratch_prefix, job, aws_utils.S3_SCRATCH_ERROR)
-    status_path = aws_utils.get_job_scratch_file(
-        s3_scratch_prefix, job, aws_utils.S3_SCRATCH_STATUS
+    input_path, output_path, error_path, status_path = aws_utils.get_job_scratch_paths(
+        s3_scratch_prefix, job
     )
 
     # Serialize arguments to input file.
@@ -568,23 +623,7 @@ def submit_command(
         "-c",
         "-o",
         "pipefail",
-        """
-aws s3 cp {input_path} .task_command
-chmod +x .task_command
-(
-  ./.task_command \
-  2> >(tee .task_error >&2) | tee .task_output
-) && (
-    aws s3 cp .task_output {output_path}
-    aws s3 cp .task_error {error_path}
-    echo ok | aws s3 cp - {status_path}
-) || (
-    [ -f .task_output ] && aws s3 cp .task_output {output_path}
-    [ -f .task_error ] && aws s3 cp .task_error {error_path}
-    echo fail | aws s3 cp - {status_path}
-    {exit_command}
-)
-""".format(
+        SCRIPT_COMMAND_TEMPLATE.format(
             input_path=quote(input_path),
             output_path=quote(output_path),
             error_path=quote(error_path),
@@ -626,8 +665,7 @@ def parse_task_error(
     """
     assert job.task
 
-    error_path = aws_utils.get_job_scratch_file(s3_scratch_prefix, job, aws_utils.S3_SCRATCH_ERROR)
-    error_file = File(error_path)
+    error_file = File(aws_utils.get_job_scratch_paths(s3_scratch_prefix, job).error)
 
     if not job.task.script:
         # Normal Tasks (non-script) store errors as Pickled exception, traceback tuples.
@@ -669,10 +707,17 @@ def parse_task_logs(
     """
     Iterates through most recent CloudWatch logs of an AWS Batch Job.
     """
+    # Request only as many events per page as we plan to display.
     lines_iter = iter_batch_job_log_lines(
-        batch_job_id, reverse=True, required=required, aws_region=aws_region
+        batch_job_id,
+        reverse=True,
+        required=required,
+        aws_region=aws_region,
+        limit=min(max_lines, MAX_LOG_EVENTS_LIMIT) or None,
     )
-    lines = reversed(list(islice(lines_iter, 0, max_lines)))
+    # Lines arrive newest first, so prepend them to restore chronological order.
+    lines: Deque[str] = deque(maxlen=max_lines)
+    lines.extendleft(islice(lines_iter, 0, max_lines))
 
     if next(lines_iter, None) is not None:
         yield "\n*** Earlier logs are truncated ***\n"
@@ -680,12 +725,13 @@ def parse_task_logs(
 
 
 def aws_describe_jobs(
-    job_ids: List[str], chunk_size: int = 100, aws_region: str = aws_utils.DEFAULT_AWS_REGION
+    job_ids: List[str],
+    chunk_size: int = DESCRIBE_JOBS_CHUNK_SIZE,
+    aws_region: str = aws_utils.DEFAULT_AWS_REGION,
 ) -> Iterator[dict]:
     """
     Returns AWS Batch Job descriptions from the AWS API.
     """
-    # The AWS Batch API can only query up to 100 jobs at a time.
     batch_client = aws_utils.get_aws_client("batch", aws_region=aws_region)
     for i in range(0, len(job_ids), chunk_size):
         chunk_job_ids = job_ids[i : i + chunk_size]
@@ -824,12 +870,14 @@ def iter_batch_job_log_lines(
     log_group_name: str = BATCH_LOG_GROUP,
     reverse: bool = False,
     required: bool = True,
+    limit: Optional[int] = None,
 ) -> Iterator[str]:
     """
     Iterate through the log lines of an AWS Batch job.
     """
     events = iter_batch_job_logs(
         job_id,
+        limit=limit,
         reverse=reverse,
         log_group_name=log_group_name,
         required=required,
@@ -842,21 +890,16 @@ def iter_local_job_status(s3_scratch_prefix: str, job_id2job: Dict[str, "Job"])
     """
     Returns local Docker jobs grouped by their status.
     """
-    running_containers = subprocess.check_output(["docker", "ps", "--no-trunc"]).decode("utf8")
+    running_containers = set(
+        subprocess.check_output(["docker", "ps", "--quiet", "--no-trunc"]).decode("utf8").split()
+    )
 
     for job_id, redun_job in job_id2job.items():
         if job_id not in running_containers:
             # Job is done running.
-            status_file = File(
-                aws_utils.get_job_scratch_file(
-                    s3_scratch_prefix, redun_job, aws_utils.S3_SCRATCH_STATUS
-                )
-            )
-            output_file = File(
-                aws_utils.get_job_scratch_file(
-                    s3_scratch_prefix, redun_job, aws_utils.S3_SCRATCH_OUTPUT
-                )
-            )
+            scratch_paths = aws_utils.get_job_scratch_paths(s3_scratch_prefix, redun_job)
+            status_file = File(scratch_paths.status)
+            output_file = File(scratch_paths.output)
 
             # Get docker logs and remove container.
             logs = subprocess.check_output(["docker", "logs", job_id]).decode("utf8")
@@ -918,16 +961,29 @@ class AWSBatchExecutor(Executor):
         self.use_default_batch_tags = config.getboolean("default_batch_tags", True)
 
         self.is_running = False
-        # We use an OrderedDict in order to retain submission order.
-        self.pending_batch_jobs: Dict[str, "Job"] = OrderedDict()
+        # Dicts retain insertion order, which we use to retain submission order.
+        self.pending_batch_jobs: Dict[str, "Job"] = {}
         self.preexisting_batch_jobs: Dict[str, str] = {}  # Job hash -> Job ID
+        self._existing_batch_job_ids: Optional[Set[str]] = None
 
         if not self.debug:
             self.interval = config.getfloat("job_monitor_interval", 5.0)
         else:
             self.interval = config.getfloat("job_monitor_interval", 0.2)
+        # Polling backs off up to this interval while no jobs are finishing.
+        self.max_interval = max(
+            config.getfloat("job_monitor_max_interval", self.interval), self.interval
+        )
 
         self._thread: Optional[threading.Thread] = None
+
+        # Thread pool for concurrent S3 and AWS API calls. It is long-lived so that
+        # its threads keep their per-thread S3 and boto clients between calls.
+        self.max_workers = config.getint("max_workers", 32)
+        self._thread_executor: Optional[ThreadPoolExecutor] = None
+        self._thread_executor_lock = threading.Lock()
+        self._log_fetch_semaphore = threading.Semaphore(MAX_CONCURRENT_LOG_FETCHES)
+
         self.arrayer = JobArrayer(
             executor=self,
             submit_interval=self.interval,
@@ -936,10 +992,12 @@ class AWSBatchExecutor(Executor):
             max_array_size=config.getint("max_array_size", 1000),
         )
         self._aws_user: Optional[str] = None
+        self._empty_input_path: Optional[str] = None
 
     def gather_inflight_jobs(self) -> None:
 
         running_arrays: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        self._existing_batch_job_ids = None
 
         # Get all running jobs by name
         inflight_jobs = self.get_jobs(BATCH_JOB_STATUSES.inflight)
@@ -990,7 +1048,7 @@ class AWSBatchExecutor(Executor):
         Start monitoring thread.
         """
         if not self.is_running:
-            self._aws_user = aws_utils.get_aws_user()
+            self._get_thread_executor()
 
             self.is_running = True
             self._thread = threading.Thread(target=self._monitor, daemon=False)
@@ -1011,6 +1069,29 @@ class AWSBatchExecutor(Executor):
         ):
             self._thread.join()
 
+        # Stop thread pool.
+        with self._thread_executor_lock:
+            if self._thread_executor:
+                self._thread_executor.shutdown()
+                self._thread_executor = None
+
+    def _get_thread_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool, starting it if needed.
+        """
+        with self._thread_executor_lock:
+            if not self._thread_executor:
+                self._thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._thread_executor
+
+    def _map_concurrently(self, func: Callable[[T], S], items: List[T]) -> List[S]:
+        """
+        Apply `func` to each item on the thread pool, returning results in order.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._get_thread_executor().map(func, items))
+
     def _monitor(self) -> None:
         """
         Thread for monitoring running AWS Batch jobs.
@@ -1025,7 +1106,10 @@ class AWSBatchExecutor(Executor):
           of API calls. 100 job ids is the maximum supported amount by
           `describe_jobs()`.
         - We do only one describe_jobs() API call per monitor loop, and then
-          sleep `self.interval` seconds.
+          sleep `self.interval` seconds. While no jobs are finishing, the sleep
+          backs off by `MONITOR_BACKOFF_FACTOR` up to `self.max_interval`, and
+          resets to `self.interval` as soon as any job finishes or new jobs are
+          submitted.
         - AWS Batch runs jobs in approximately the order submitted. So if we
           monitor job statuses in submission order, a run of PENDING statuses
           (`pending_truncate`) suggests the rest of the jobs will be PENDING.
@@ -1038,12 +1122,15 @@ class AWSBatchExecutor(Executor):
         thread low so as to not interfere with new submissions.
         """
         assert self.scheduler
-        chunk_size = 100
+        chunk_size = DESCRIBE_JOBS_CHUNK_SIZE
         pending_truncate = 10
+        interval = self.interval
+        num_jobs = 0
 
         try:
             while self.is_running and (self.pending_batch_jobs or self.arrayer.num_pending):
-                if self.scheduler.logger.level >= logging.DEBUG:
+                # Only build the (possibly long) list of job ids when it will be logged.
+                if self.scheduler.logger.isEnabledFor(logging.DEBUG):
                     self.log(
                         f"Preparing {self.arrayer.num_pending} job(s) for Job Arrays.",
                         level=logging.DEBUG,
@@ -1060,20 +1147,33 @@ class AWSBatchExecutor(Executor):
                         pending_truncate=pending_truncate,
                         aws_region=self.aws_region,
                     )
-                    for i, job in enumerate(jobs):
-                        self._process_job_status(job)
-                        if i % chunk_size == 0:
-                            # Sleep after every chunk to avoid excessive API calls.
-                            time.sleep(self.interval)
+                    num_finished = 0
+                    while True:
+                        chunk = list(islice(jobs, chunk_size))
+                        num_finished += self._process_job_statuses(chunk)
+                        if len(chunk) < chunk_size:
+                            break
+                        # Sleep between chunks to avoid excessive API calls. `jobs` is
+                        # lazy, so the next chunk is only described after the sleep.
+                        time.sleep(self.interval)
 
                 else:
                     # Copy pending_batch_jobs since it can change due to new submissions.
                     jobs = iter_local_job_status(
                         self.s3_scratch_prefix, dict(self.pending_batch_jobs)
                     )
-                    for job in jobs:
-                        self._process_job_status(job)
-                time.sleep(self.interval)
+                    num_finished = self._process_job_statuses(list(jobs))
+
+                # Only this thread removes pending jobs, and exactly `num_finished` of
+                # them, so any other growth since the last loop means new submissions.
+                num_pending_jobs = len(self.pending_batch_jobs)
+                has_new_jobs = num_pending_jobs > num_jobs - num_finished
+                num_jobs = num_pending_jobs
+                if num_finished or has_new_jobs:
+                    interval = self.interval
+                else:
+                    interval = min(interval * MONITOR_BACKOFF_FACTOR, self.max_interval)
+                time.sleep(interval)
 
         except Exception as error:
             # Since we run this is method at the top-level of a thread, we
@@ -1101,95 +1201,178 @@ class AWSBatchExecutor(Executor):
             if redun_job.task.script:
                 # Script tasks will report their status in a status file.
                 status_file = File(
-                    aws_utils.get_job_scratch_file(
-                        self.s3_scratch_prefix, redun_job, aws_utils.S3_SCRATCH_STATUS
-                    )
+                    aws_utils.get_job_scratch_paths(self.s3_scratch_prefix, redun_job).status
                 )
                 if status_file.exists():
                     return status_file.read().strip() == "ok", container_reason
             else:
                 # Non-script tasks only create an output file if it is successful.
                 output_file = File(
-                    aws_utils.get_job_scratch_file(
-                        self.s3_scratch_prefix, redun_job, aws_utils.S3_SCRATCH_OUTPUT
-                    )
+                    aws_utils.get_job_scratch_paths(self.s3_scratch_prefix, redun_job).output
                 )
                 return output_file.exists(), container_reason
 
         return False, container_reason
 
-    def _process_job_status(self, job: dict) -> None:
+    def _process_job_statuses(self, jobs: List[dict]) -> int:
+        """
+        Process a batch of AWS Batch job statuses.
+
+        Outputs of succeeded jobs and errors of failed jobs are fetched
+        concurrently, and then the scheduler is updated in the order of `jobs`.
+        Returns the number of jobs that finished.
+        """
+        # Statuses are only requested for pending jobs, and only this thread removes them.
+        succeeded_jobs = {
+            job["jobId"]: self.pending_batch_jobs[job["jobId"]]
+            for job in jobs
+            if job["status"] == SUCCEEDED
+        }
+        failed_jobs = [job for job in jobs if job["status"] == FAILED]
+        job_outputs = dict(
+            zip(
+                succeeded_jobs,
+                self._get_job_outputs(list(succeeded_jobs.values()), check_valid=False),
+            )
+        )
+        job_failures = dict(
+            zip([job["jobId"] for job in failed_jobs], self._get_job_failures(failed_jobs))
+        )
+        for job in jobs:
+            self._process_job_status(
+                job,
+                job_output=job_outputs.get(job["jobId"]),
+                job_failure=job_failures.get(job["jobId"]),
+            )
+        return len(succeeded_jobs) + len(failed_jobs)
+
+    def _process_job_status(
+        self,
+        job: dict,
+        job_output: Optional[Tuple[Any, bool]] = None,
+        job_failure: Optional[JobFailure] = None,
+    ) -> None:
         """
         Process AWS Batch job statuses.
+
+        `job_output` is the job's (result, exists) output and `job_failure` is
+        the failed job's details, if already fetched.
         """
         assert self.scheduler
-        job_status: Optional[str] = None
 
-        # Determine job status.
+        # Succeeded jobs are the common case, so dispatch them first.
         if job["status"] == SUCCEEDED:
-            job_status = SUCCEEDED
+            redun_job = self.pending_batch_jobs.pop(job["jobId"])
+            self._handle_succeeded(job, redun_job, job_output=job_output)
 
         elif job["status"] == FAILED:
-            can_override, container_reason = self._can_override_failed(job)
+            if job_failure is None:
+                job_failure = self._get_job_failure(job)
+            can_override, container_reason, job_error = job_failure
+            redun_job = self.pending_batch_jobs.pop(job["jobId"])
             if can_override:
-                job_status = SUCCEEDED
                 self.scheduler.log("NOTE: Overriding AWS Batch error: {}".format(container_reason))
+                self._handle_succeeded(job, redun_job, job_output=job_output)
             else:
-                job_status = FAILED
+                assert job_error
+                self._handle_failed(job, redun_job, job_error)
+
+    def _get_job_failure(self, job: dict) -> JobFailure:
+        """
+        Returns the details of a failed AWS Batch job.
+
+        Returns a tuple of (can_override, container_reason, job_error), where
+        job_error is the (error, error_traceback) of the redun Job, or None if
+        the failure can be overridden.
+        """
+        can_override, container_reason = self._can_override_failed(job)
+        if can_override:
+            return can_override, container_reason, None
+
+        redun_job = self.pending_batch_jobs[job["jobId"]]
+        error, error_traceback = parse_task_error(
+            self.s3_scratch_prefix, redun_job, batch_job_metadata=job
+        )
+        if not self.debug:
+            logs = [f"*** CloudWatch logs for AWS Batch job {job['jobId']}:\n"]
+            if container_reason:
+                logs.append(f"container.reason: {container_reason}\n")
+
+            try:
+                status_reason = job["attempts"][-1]["statusReason"]
+            except (KeyError, IndexError):
+                status_reason = ""
+            if status_reason:
+                logs.append(f"statusReason: {status_reason}\n")
+
+            with self._log_fetch_semaphore:
+                logs.extend(
+                    parse_task_logs(job["jobId"], required=False, aws_region=self.aws_region)
+                )
+            error_traceback.logs = logs
         else:
-            return
+            error_traceback.logs = [line + "\n" for line in job["logs"].split("\n")]
+        return can_override, container_reason, (error, error_traceback)
+
+    def _get_job_failures(self, jobs: List[dict]) -> List[JobFailure]:
+        """
+        Return the details of several failed AWS Batch jobs, fetching them concurrently.
+
+        At most `MAX_CONCURRENT_LOG_FETCHES` jobs fetch their CloudWatch logs at once.
+
+        Returns a list of failures, in the same order as `jobs`.
+        """
+        return self._map_concurrently(self._get_job_failure, jobs)
 
-        # Determine redun Job and job_tags.
-        redun_job = self.pending_batch_jobs.pop(job["jobId"])
-        job_tags = []
+    def _get_job_tags(self, job: dict) -> List[Tuple[str, Any]]:
+        """
+        Returns the redun job tags for an AWS Batch job.
+        """
+        job_tags: List[Tuple[str, Any]] = []
         if not self.debug:
             job_tags.append(("aws_batch_job", job["jobId"]))
             log_stream = job.get("container", {}).get("logStreamName")
             if log_stream:
                 job_tags.append(("aws_log_stream", log_stream))
+        return job_tags
 
-        if job_status == SUCCEEDED:
-            # Assume a recently completed job has valid results.
-            result, exists = self._get_job_output(redun_job, check_valid=False)
-            if exists:
-                self.scheduler.done_job(redun_job, result, job_tags=job_tags)
-            else:
-                # This can happen if job ended in an inconsistent state.
-                self.scheduler.reject_job(
-                    redun_job,
-                    FileNotFoundError(
-                        aws_utils.get_job_scratch_file(
-                            self.s3_scratch_prefix, redun_job, aws_utils.S3_SCRATCH_OUTPUT
-                        )
-                    ),
-                    job_tags=job_tags,
-                )
-        elif job_status == FAILED:
-            error, error_traceback = parse_task_error(
-                self.s3_scratch_prefix, redun_job, batch_job_metadata=job
-            )
-            if not self.debug:
-                logs = [f"*** CloudWatch logs for AWS Batch job {job['jobId']}:\n"]
-                if container_reason:
-                    logs.append(f"container.reason: {container_reason}\n")
-
-                try:
-                    status_reason = job["attempts"][-1]["statusReason"]
-                except (KeyError, IndexError):
-                    status_reason = ""
-                if status_reason:
-                    logs.append(f"statusReason: {status_reason}\n")
+    def _handle_succeeded(
+        self, job: dict, redun_job: Job, job_output: Optional[Tuple[Any, bool]] = None
+    ) -> None:
+        """
+        Complete a redun Job whose AWS Batch job succeeded.
+        """
+        assert self.scheduler
 
-                logs.extend(
-                    parse_task_logs(job["jobId"], required=False, aws_region=self.aws_region)
-                )
-                error_traceback.logs = logs
-            else:
-                error_traceback.logs = [line + "\n" for line in job["logs"].split("\n")]
+        # Assume a recently completed job has valid results.
+        if job_output is None:
+            job_output = self._get_job_output(redun_job, check_valid=False)
+        result, exists = job_output
+        if exists:
+            self.scheduler.done_job(redun_job, result, job_tags=self._get_job_tags(job))
+        else:
+            # This can happen if job ended in an inconsistent state.
             self.scheduler.reject_job(
-                redun_job, error, error_traceback=error_traceback, job_tags=job_tags
+                redun_job,
+                FileNotFoundError(
+                    aws_utils.get_job_scratch_paths(self.s3_scratch_prefix, redun_job).output
+                ),
+                job_tags=self._get_job_tags(job),
             )
 
+    def _handle_failed(
+        self, job: dict, redun_job: Job, job_error: Tuple[Exception, Traceback]
+    ) -> None:
+        """
+        Reject a redun Job whose AWS Batch job failed.
+        """
+        assert self.scheduler
+
+        error, error_traceback = job_error
+        self.scheduler.reject_job(
+            redun_job, error, error_traceback=error_traceback, job_tags=self._get_job_tags(job)
+        )
+
     def _get_job_options(self, job: Job) -> dict:
         """
         Determine the task options for a job.
@@ -1243,17 +1426,39 @@ class AWSBatchExecutor(Executor):
         """
         assert self.scheduler
 
-        output_file = File(
-            aws_utils.get_job_scratch_file(
-                self.s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-            )
-        )
+        output_file = File(aws_utils.get_job_scratch_paths(self.s3_scratch_prefix, job).output)
         if output_file.exists():
             result = aws_utils.parse_task_result(self.s3_scratch_prefix, job)
             if not check_valid or self.scheduler.is_valid_value(result):
                 return result, True
         return None, False
 
+    def _get_existing_batch_job_ids(self) -> Set[str]:
+        """
+        Returns the ids of preexisting Batch jobs that the AWS Batch API still has.
+
+        All preexisting jobs are described together on first use, instead of
+        making an API call for each job we reunite with.
+        """
+        if self._existing_batch_job_ids is None:
+            self._existing_batch_job_ids = {
+                batch_job["jobId"]
+                for batch_job in aws_describe_jobs(
+                    list(self.preexisting_batch_jobs.values()), aws_region=self.aws_region
+                )
+            }
+        return self._existing_batch_job_ids
+
+    def _get_job_outputs(
+        self, jobs: List[Job], check_valid: bool = True
+    ) -> List[Tuple[Any, bool]]:
+        """
+        Return the outputs of several jobs, fetching them concurrently.
+
+        Returns a list of (result, exists) tuples, in the same order as `jobs`.
+        """
+        return self._map_concurrently(partial(self._get_job_output, check_valid=check_valid), jobs)
+
     def _submit(self, job: Job, args: Tuple, kwargs: dict) -> None:
         """
         Submit Job to executor.
@@ -1271,6 +1476,11 @@ class AWSBatchExecutor(Executor):
             # Precompute existing inflight jobs for job reuniting.
             self.gather_inflight_jobs()
 
+        # Default batch tags include the AWS user, which is needed before the job
+        # options are computed below.
+        if not self.is_running:
+            self._aws_user = aws_utils.get_aws_user()
+
         # Package code if necessary and we have not already done so. If code_package is False,
         # then we can skip this step. Additionally, if we have already packaged and set code_file,
         # then we do not need to repackage.
@@ -1279,9 +1489,6 @@ class AWSBatchExecutor(Executor):
             assert isinstance(code_package, dict)
             self.code_file = aws_utils.package_code(self.s3_scratch_prefix, code_package)
 
-        job_dir = aws_utils.get_job_scratch_dir(self.s3_scratch_prefix, job)
-        job_type = "AWS Batch job" if not self.debug else "Docker container"
-
         # Determine job options.
         task_options = self._get_job_options(job)
         use_cache = task_options.get("cache", True)
@@ -1289,23 +1496,19 @@ class AWSBatchExecutor(Executor):
         # Determine if we can reunite with a previous Batch output or job.
         batch_job_id: Optional[str] = None
         if use_cache and job.eval_hash in self.preexisting_batch_jobs:
-            batch_job_id = self.preexisting_batch_jobs.pop(job.eval_hash)
-
             # Make sure Batch API still has a status on this job.
-            existing_job = next(
-                aws_describe_jobs([batch_job_id], aws_region=self.aws_region), None
-            )
+            existing_batch_job_ids = self._get_existing_batch_job_ids()
+            batch_job_id = self.preexisting_batch_jobs.pop(job.eval_hash)
 
             # Reunite with inflight batch job, if present.
-            if existing_job:
-                batch_job_id = existing_job["jobId"]
+            if batch_job_id in existing_batch_job_ids:
                 self.log(
                     "reunite redun job {redun_job} with {job_type} {batch_job}:\n"
                     "  s3_scratch_path = {job_dir}".format(
                         redun_job=job.id,
-                        job_type=job_type,
+                        job_type="AWS Batch job" if not self.debug else "Docker container",
                         batch_job=batch_job_id,
-                        job_dir=job_dir,
+                        job_dir=aws_utils.get_job_scratch_dir(self.s3_scratch_prefix, job),
                     )
                 )
                 assert batch_job_id
@@ -1316,14 +1519,22 @@ class AWSBatchExecutor(Executor):
         # Job arrayer will handle actual submission after bunching to an array
         # job, if necessary.
         if batch_job_id is None:
-            self.arrayer.add_job(job, args, kwargs)
+            self.arrayer.add_job(job, args, kwargs, task_options=task_options)
 
         self._start()
 
     def _submit_array_job(
-        self, jobs: List[Job], all_args: List[Tuple], all_kwargs: List[Dict]
+        self,
+        jobs: List[Job],
+        all_args: List[Tuple],
+        all_kwargs: List[Dict],
+        task_options: Optional[dict] = None,
     ) -> str:
-        """Submits an array job, returning job name uuid"""
+        """
+        Submits an array job, returning job name uuid
+
+        `task_options` are the options of the jobs, if already computed by `_submit`.
+        """
         array_size = len(jobs)
         assert array_size == len(all_args) == len(all_kwargs)
 
@@ -1333,7 +1544,8 @@ class AWSBatchExecutor(Executor):
         if job.task.script:
             raise NotImplementedError("Array jobs not supported for scripts")
 
-        task_options = self._get_job_options(job)
+        if task_options is None:
+            task_options = self._get_job_options(job)
         image = task_options.pop("image", self.image)
         queue = task_options.pop("queue", self.queue)
         # Generate a unique name for job with no '-' to simplify job name parsing.
@@ -1346,39 +1558,46 @@ class AWSBatchExecutor(Executor):
         input_file = aws_utils.get_array_scratch_file(
             self.s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_INPUT
         )
-        with File(input_file).open("wb") as out:
-            pickle_dump([all_args, all_kwargs], out)
 
-        # Output file is a plaintext list of output paths, for each child job.
+        def write_input_file() -> None:
+            File(input_file).write(pickle_dumps([all_args, all_kwargs]), mode="wb")
+
+        # Output and error files are plaintext lists of output and error paths,
+        # one for each child job.
+        output_paths: List[str] = []
+        error_paths: List[str] = []
+        for array_job in jobs:
+            scratch_paths = aws_utils.get_job_scratch_paths(self.s3_scratch_prefix, array_job)
+            output_paths.append(scratch_paths.output)
+            error_paths.append(scratch_paths.error)
+
         output_file = aws_utils.get_array_scratch_file(
             self.s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_OUTPUT
         )
-        output_paths = [
-            aws_utils.get_job_scratch_file(
-                self.s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-            )
-            for job in jobs
-        ]
-        with File(output_file).open("w") as ofile:
-            json.dump(output_paths, ofile)
 
-        # Error file is a plaintext list of error paths, one for each child job.
+        def write_output_file() -> None:
+            File(output_file).write(json.dumps(output_paths))
+
         error_file = aws_utils.get_array_scratch_file(
             self.s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_ERROR
         )
-        error_paths = [
-            aws_utils.get_job_scratch_file(self.s3_scratch_prefix, job, aws_utils.S3_SCRATCH_ERROR)
-            for job in jobs
-        ]
-        with File(error_file).open("w") as efile:
-            json.dump(error_paths, efile)
+
+        def write_error_file() -> None:
+            File(error_file).write(json.dumps(error_paths))
 
         # Eval hash file is plaintext hashes of child jobs for matching for job reuniting.
         eval_file = aws_utils.get_array_scratch_file(
             self.s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_HASHES
         )
-        with File(eval_file).open("w") as eval_f:
-            eval_f.write("\n".join([job.eval_hash for job in jobs]))  # type: ignore
+
+        def write_eval_file() -> None:
+            File(eval_file).write("\n".join(job.eval_hash for job in jobs))  # type: ignore
+
+        # Each scratch file is a separate S3 request, so write them concurrently.
+        self._map_concurrently(
+            lambda write: write(),
+            [write_input_file, write_output_file, write_error_file, write_eval_file],
+        )
 
         batch_resp = submit_task(
             image,
@@ -1426,13 +1645,51 @@ class AWSBatchExecutor(Executor):
 
         return array_uuid
 
-    def _submit_single_job(self, job: Job, args: Tuple, kwargs: dict) -> None:
+    def _get_empty_input_path(self) -> str:
+        """
+        Returns the input file shared by all jobs without arguments.
+
+        The file is uploaded on first use, saving an upload for every later job.
+        """
+        if not self._empty_input_path:
+            input_path = aws_utils.get_empty_input_scratch_file(self.s3_scratch_prefix)
+            File(input_path).write(pickle_dumps([(), {}]), mode="wb")
+            self._empty_input_path = input_path
+        return self._empty_input_path
+
+    def _submit_single_jobs(self, jobs: List[PendingJob]) -> None:
+        """
+        Submits several individual jobs, concurrently when possible.
+
+        In debug mode, jobs run as local Docker containers that are interactive
+        by default, so they are started one at a time. Otherwise, the first job
+        is submitted alone so that it creates any needed job definition, since
+        concurrent cache misses in `get_or_create_job_definition()` would each
+        register a new revision. The rest are then submitted on the thread pool.
+        """
+        if self.debug or len(jobs) <= 1:
+            for pending_job in jobs:
+                self._submit_single_job(*pending_job)
+            return
+
+        first_job, *other_jobs = jobs
+        self._submit_single_job(*first_job)
+        self._map_concurrently(
+            lambda pending_job: self._submit_single_job(*pending_job), other_jobs
+        )
+
+    def _submit_single_job(
+        self, job: Job, args: Tuple, kwargs: dict, task_options: Optional[dict] = None
+    ) -> None:
         """
         Actually submits a job. Caching detects if it should be part
         of an array job
+
+        `task_options` are the options of the job, if already computed by `_submit`.
         """
         assert job.task
-        task_options = self._get_job_options(job)
+        if task_options is None:
+            task_options = self._get_job_options(job)
         image = task_options.pop("image", self.image)
         queue = task_options.pop("queue", self.queue)
 
@@ -1453,6 +1710,7 @@ class AWSBatchExecutor(Executor):
                 debug=self.debug,
                 code_file=self.code_file,
                 aws_region=self.aws_region,
+                input_path=self._get_empty_input_path() if not args and not kwargs else None,
             )
         else:
             command = get_task_command(job.task, args, kwargs)
@@ -1533,8 +1791,14 @@ class AWSBatchExecutor(Executor):
     ) -> Iterator[dict]:
         """
         Kill AWS Batch Jobs.
+
+        Terminate requests are sent concurrently and responses are yielded in
+        the order of `job_ids`.
         """
-        batch_client = aws_utils.get_aws_client("batch", aws_region=self.aws_region)
 
-        for job_id in job_ids:
-            yield batch_client.terminate_job(jobId=job_id, reason=reason)
+        def terminate_job(job_id: str) -> dict:
+            # Clients are cached per thread, since boto clients are not thread safe.
+            batch_client = aws_utils.get_aws_client("batch", aws_region=self.aws_region)
+            return batch_client.terminate_job(jobId=job_id, reason=reason)
+
+        yield from self._map_concurrently(terminate_job, list(job_ids))
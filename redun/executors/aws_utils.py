@@ -6,6 +6,7 @@ import tarfile
 import tempfile
 import threading
 import zipfile
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 import boto3
@@ -21,16 +22,26 @@ DEFAULT_AWS_REGION = "us-west-2"
 
 # S3 scratch filenames.
 S3_SCRATCH_INPUT = "input"
+S3_SCRATCH_EMPTY_INPUT = "empty"
 S3_SCRATCH_OUTPUT = "output"
 S3_SCRATCH_CODE = "code.tar.gz"
 S3_SCRATCH_ERROR = "error"
 S3_SCRATCH_HASHES = "eval_hashes"
 S3_SCRATCH_STATUS = "status"
+# Number of jobs whose scratch paths are memoized.
+SCRATCH_PATHS_CACHE_SIZE = 10000
 
 # Cache for AWS Clients.
 _boto_clients: Dict[Tuple[int, str, str], boto3.Session] = {}
 
 
+class ScratchPaths(NamedTuple):
+    input: str
+    output: str
+    error: str
+    status: str
+
+
 class JobStatus(NamedTuple):
     all: List[str]
     pending: List[str]
@@ -133,6 +144,42 @@ def get_job_scratch_file(s3_scratch_prefix: str, job: Job, filename: str) -> str
     return os.path.join(s3_scratch_prefix, "jobs", job.eval_hash, filename)
 
 
+def get_job_scratch_paths(s3_scratch_prefix: str, job: Job) -> ScratchPaths:
+    """
+    Returns s3 scratch paths for the input, output, error, and status files of a redun Job.
+    """
+    assert job.eval_hash
+    return _get_job_scratch_paths(s3_scratch_prefix, job.eval_hash)
+
+
+@lru_cache(maxsize=SCRATCH_PATHS_CACHE_SIZE)
+def _get_job_scratch_paths(s3_scratch_prefix: str, eval_hash: str) -> ScratchPaths:
+    """
+    Returns the scratch paths for a job's eval_hash, memoized since they are
+    needed at submission, monitoring, and result parsing.
+    """
+    return _get_scratch_paths(os.path.join(s3_scratch_prefix, "jobs", eval_hash))
+
+
+def _get_scratch_paths(scratch_dir: str) -> ScratchPaths:
+    """
+    Returns the scratch paths for the files within a scratch directory.
+    """
+    return ScratchPaths(
+        input=os.path.join(scratch_dir, S3_SCRATCH_INPUT),
+        output=os.path.join(scratch_dir, S3_SCRATCH_OUTPUT),
+        error=os.path.join(scratch_dir, S3_SCRATCH_ERROR),
+        status=os.path.join(scratch_dir, S3_SCRATCH_STATUS),
+    )
+
+
+def get_empty_input_scratch_file(s3_scratch_prefix: str) -> str:
+    """
+    Returns s3 scratch path for the input file shared by jobs without arguments.
+    """
+    return os.path.join(s3_scratch_prefix, "inputs", S3_SCRATCH_EMPTY_INPUT)
+
+
 def get_code_scratch_file(s3_scratch_prefix: str, tar_hash: str, use_zip: bool = False) -> str:
     """
     Returns s3 scratch path for a code package tar file.
@@ -147,6 +194,14 @@ def get_array_scratch_file(s3_scratch_prefix: str, job_array_id: str, filename:
     return os.path.join(s3_scratch_prefix, "array_jobs", job_array_id, filename)
 
 
+def get_array_scratch_paths(s3_scratch_prefix: str, job_array_id: str) -> ScratchPaths:
+    """
+    Returns S3 scratch paths for the input, output, error, and status files of an AWS batch
+    array job.
+    """
+    return _get_scratch_paths(os.path.join(s3_scratch_prefix, "array_jobs", job_array_id))
+
+
 def copy_to_s3(file_path: str, s3_scratch_dir: str) -> str:
     """
     Copies a file to the S3 scratch directory if it is not already on S3.
@@ -218,9 +273,7 @@ def parse_task_result(s3_scratch_prefix: str, job: Job) -> Any:
     """
     Parse task result from s3 scratch path.
     """
-    output_path = get_job_scratch_file(s3_scratch_prefix, job, S3_SCRATCH_OUTPUT)
-
-    output_file = File(output_path)
+    output_file = File(get_job_scratch_paths(s3_scratch_prefix, job).output)
     assert job.task
     if not job.task.script:
         with output_file.open("rb") as infile:
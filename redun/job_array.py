@@ -2,7 +2,7 @@ import threading
 import time
 import weakref
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 
 from redun.scheduler import Job
 
@@ -39,6 +39,7 @@ class PendingJob(NamedTuple):
     job: Job
     args: tuple
     kwargs: Dict[str, Any]
+    task_options: Optional[dict] = None
 
 
 class JobArrayer:
@@ -145,19 +146,30 @@ class JobArrayer:
         if self._monitor_thread.is_alive():
             self._monitor_thread.join()
 
-    def add_job(self, job: Job, args: Tuple, kwargs: Dict[str, Any]):
-        """Adds a new job"""
+    def add_job(
+        self,
+        job: Job,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        task_options: Optional[dict] = None,
+    ):
+        """
+        Adds a new job
+
+        `task_options` are the job's executor options, if already computed, and
+        are passed along when the job is submitted.
+        """
         assert job.task
 
         # If arraying is turned off, just submit the job.
         # Script jobs are also not handled yet.
         if job.task.script or not self.min_array_size:
-            self.executor._submit_single_job(job, args, kwargs)
+            self.executor._submit_single_job(job, args, kwargs, task_options)
             return
 
         descr = JobDescription(job)
         with self._lock:
-            self.pending[descr].append(PendingJob(job, args, kwargs))
+            self.pending[descr].append(PendingJob(job, args, kwargs, task_options))
             self.pending_timestamps[descr] = time.time()
             self.num_pending += 1
 
@@ -191,8 +203,7 @@ class JobArrayer:
                 self.pending_timestamps[descr] = timestamp
 
         elif len(jobs) < self.min_array_size:
-            for job in jobs:
-                self.submit_single_job(job)
+            self.submit_single_jobs(jobs)
         else:
             self.submit_array_job(jobs)
 
@@ -203,8 +214,17 @@ class JobArrayer:
         all_args = [job.args for job in jobs]
         all_kwargs = [job.kwargs for job in jobs]
 
-        array_uuid = self.executor._submit_array_job(all_jobs, all_args, all_kwargs)
+        # Array jobs are submitted with the options of their first job.
+        array_uuid = self.executor._submit_array_job(
+            all_jobs, all_args, all_kwargs, jobs[0].task_options
+        )
         return array_uuid
 
     def submit_single_job(self, job: PendingJob) -> None:
-        self.executor._submit_single_job(job.job, job.args, job.kwargs)
+        self.executor._submit_single_job(job.job, job.args, job.kwargs, job.task_options)
+
+    def submit_single_jobs(self, jobs: List[PendingJob]) -> None:
+        """
+        Submit several individual jobs, which the executor may do concurrently.
+        """
+        self.executor._submit_single_jobs(jobs)
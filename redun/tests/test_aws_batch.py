@@ -1,10 +1,12 @@
 import json
 import os
 import pickle
+import threading
 import time
 import uuid
 from typing import cast
 from unittest.mock import Mock, patch
+from urllib.error import URLError
 
 import boto3
 import pytest
@@ -20,17 +22,23 @@ from redun.executors.aws_batch import (
     BATCH_JOB_STATUSES,
     BATCH_LOG_GROUP,
     FAILED,
+    MAX_CONCURRENT_LOG_FETCHES,
     SUCCEEDED,
     AWSBatchError,
     AWSBatchExecutor,
     batch_submit,
+    get_aws_credentials,
     get_batch_job_name,
     get_hash_from_job_name,
     get_job_definition,
+    is_ec2_instance,
     iter_batch_job_log_lines,
     iter_batch_job_logs,
+    iter_local_job_status,
     make_job_def_name,
     parse_task_error,
+    parse_task_logs,
+    run_docker,
     submit_task,
 )
 from redun.executors.aws_utils import (
@@ -40,6 +48,7 @@ from redun.executors.aws_utils import (
     find_code_files,
     get_array_scratch_file,
     get_job_scratch_file,
+    get_job_scratch_paths,
     package_code,
     parse_code_package_config,
 )
@@ -102,6 +111,60 @@ def test_required_job_def_name(get_job_definition_mock, _) -> None:
         )
 
 
+@patch("redun.executors.aws_utils.get_aws_client")
+def test_kill_jobs(get_aws_client_mock, scheduler: Scheduler) -> None:
+    """
+    kill_jobs() should terminate every job and yield responses in order.
+    """
+    get_aws_client_mock.return_value.terminate_job.side_effect = lambda jobId, reason: {
+        "jobId": jobId
+    }
+    config = Config(
+        {
+            "batch": {
+                "image": "image",
+                "queue": "queue",
+                "s3_scratch": "s3_scratch_prefix",
+            }
+        }
+    )
+    executor = AWSBatchExecutor("batch", scheduler, config["batch"])
+
+    job_ids = [f"job{i}" for i in range(20)]
+    responses = list(executor.kill_jobs(job_ids, reason="stop"))
+    assert responses == [{"jobId": job_id} for job_id in job_ids]
+    get_aws_client_mock.return_value.terminate_job.assert_any_call(jobId="job0", reason="stop")
+
+
+def test_executor_thread_pool(scheduler: Scheduler) -> None:
+    """
+    Concurrent S3 and AWS calls should reuse one thread pool until the executor stops.
+    """
+    config = Config(
+        {
+            "batch": {
+                "image": "image",
+                "queue": "queue",
+                "s3_scratch": "s3_scratch_prefix",
+                "max_workers": "4",
+            }
+        }
+    )
+    executor = AWSBatchExecutor("batch", scheduler, config["batch"])
+
+    thread_ids = executor._map_concurrently(lambda i: threading.get_ident(), list(range(20)))
+    pool = executor._thread_executor
+    assert pool
+    assert len(set(thread_ids)) <= 4
+
+    # The same pool, and therefore the same threads, are used for later calls.
+    assert executor._map_concurrently(lambda i: i * 2, [1, 2, 3]) == [2, 4, 6]
+    assert executor._thread_executor is pool
+
+    executor.stop()
+    assert executor._thread_executor is None
+
+
 @pytest.mark.parametrize("array,suffix", [(False, ""), (True, "-array")])
 def test_get_hash_from_job_name(array, suffix) -> None:
     """
@@ -212,6 +275,13 @@ def test_executor_config(scheduler: Scheduler) -> None:
     assert isinstance(executor.code_package, dict)
     assert executor.code_package["includes"] == ["*.txt"]
     assert executor.debug is False
+    assert executor.interval == 5.0
+    # Monitor backoff is disabled by default.
+    assert executor.max_interval == 5.0
+
+    config["batch"]["job_monitor_max_interval"] = "60"
+    executor = AWSBatchExecutor("batch", scheduler, config["batch"])
+    assert executor.max_interval == 60.0
 
 
 @task()
@@ -384,6 +454,58 @@ def task1(x):
     )
 
 
+def test_get_job_scratch_paths() -> None:
+    """
+    Scratch paths for a job should match the individual scratch files.
+    """
+    s3_scratch_prefix = "s3://example-bucket/redun/"
+    job = Job(task1(10))
+    job.eval_hash = "eval_hash"
+
+    paths = get_job_scratch_paths(s3_scratch_prefix, job)
+    assert paths.input == "s3://example-bucket/redun/jobs/eval_hash/input"
+    assert paths == tuple(
+        get_job_scratch_file(s3_scratch_prefix, job, filename)
+        for filename in ["input", "output", "error", "status"]
+    )
+
+    # Paths are memoized by eval_hash.
+    job2 = Job(task1(10))
+    job2.eval_hash = "eval_hash"
+    assert get_job_scratch_paths(s3_scratch_prefix, job2) is paths
+
+
+@patch("redun.executors.aws_batch.run_docker")
+@pytest.mark.parametrize("interactive", [True, False])
+def test_submit_task_docker_array(run_docker_mock, interactive) -> None:
+    """
+    Debug array jobs should launch one Docker container per array index.
+    """
+    run_docker_mock.side_effect = lambda command, image, array_index, **kwargs: (
+        f"container-{array_index}"
+    )
+    job = Job(task1(10))
+    job.id = "123"
+    job.eval_hash = "eval_hash"
+
+    result = submit_task(
+        "my-image",
+        "queue",
+        "s3://example-bucket/redun/",
+        job,
+        task1,
+        job_options={"interactive": interactive},
+        array_uuid="array_uuid",
+        array_size=3,
+        debug=True,
+    )
+    assert result == {
+        "jobId": ["container-0", "container-1", "container-2"],
+        "redun_job_id": ["123", "123", "123"],
+    }
+    assert {call[1]["interactive"] for call in run_docker_mock.call_args_list} == {interactive}
+
+
 @mock_s3
 def test_parse_task_error() -> None:
     """
@@ -524,6 +646,14 @@ def test_iter_batch_job_logs(aws_describe_jobs_mock) -> None:
         "2020-10-12 23:47:14.003000  A message 4.",
     ]
 
+    # Fetch the most recent log lines.
+    assert list(parse_task_logs(job_id, max_lines=2)) == [
+        "\n*** Earlier logs are truncated ***\n",
+        "2020-10-12 23:47:14.002000  A message 3.",
+        "2020-10-12 23:47:14.003000  A message 4.",
+    ]
+    assert list(parse_task_logs(job_id, max_lines=10)) == lines
+
     # Fetch logs from unknown job.
     aws_describe_jobs_mock.side_effect = lambda *args, **kwargs: iter([])
     assert list(iter_batch_job_logs("unknown_job_id")) == []
@@ -548,6 +678,92 @@ def test_iter_batch_job_logs(aws_describe_jobs_mock) -> None:
     assert list(iter_batch_job_logs(job_id, required=False)) == []
 
 
+@mock_s3
+@patch("redun.executors.aws_batch.subprocess.check_output")
+def test_iter_local_job_status(check_output_mock) -> None:
+    """
+    Only containers no longer reported by `docker ps` should be reported as done.
+    """
+    s3_scratch_prefix = "s3://example-bucket/redun/"
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="example-bucket")
+
+    job1 = Job(task1(1))
+    job1.eval_hash = "eval_hash1"
+    job2 = Job(task1(2))
+    job2.eval_hash = "eval_hash2"
+    File(get_job_scratch_file(s3_scratch_prefix, job1, "status")).write("ok\n")
+
+    def check_output(command):
+        if command[:2] == ["docker", "ps"]:
+            # The finished container id is a prefix of the running one, so a
+            # substring search would mistake it for still running.
+            return b"container2\n"
+        return b""
+
+    check_output_mock.side_effect = check_output
+
+    statuses = list(
+        iter_local_job_status(s3_scratch_prefix, {"container": job1, "container2": job2})
+    )
+    assert [(status["jobId"], status["status"]) for status in statuses] == [
+        ("container", SUCCEEDED)
+    ]
+
+
+@patch("redun.executors.aws_batch.is_ec2_instance", return_value=True)
+@patch("redun.executors.aws_batch.subprocess.check_call")
+@patch("redun.executors.aws_batch.subprocess.check_output")
+def test_run_docker(check_output_mock, check_call_mock, is_ec2_instance_mock) -> None:
+    """
+    run_docker should return the container id for interactive and background runs.
+    """
+    check_output_mock.return_value = b"container-id\n"
+
+    assert run_docker(["ls"], image="my-image", interactive=True) == "container-id"
+    command = check_output_mock.call_args[0][0]
+    assert command[:3] == ["docker", "create", "-it"]
+    assert command[-2:] == ["my-image", "ls"]
+    assert check_call_mock.call_args[0][0] == ["docker", "start", "-ai", "container-id"]
+    assert check_call_mock.call_args[1]["env"]["NORAW"] == "true"
+
+    check_call_mock.reset_mock()
+    assert run_docker(["ls"], image="my-image", interactive=False) == "container-id"
+    assert check_output_mock.call_args[0][0][:3] == ["docker", "run", "-d"]
+    assert not check_call_mock.called
+
+
+@patch("redun.executors.aws_batch.boto3.Session")
+@patch("redun.executors.aws_batch.urlopen", side_effect=URLError("not on EC2"))
+@patch("redun.executors.aws_batch.subprocess.check_output", return_value=b"container-id\n")
+def test_run_docker_credentials(check_output_mock, urlopen_mock, session_mock) -> None:
+    """
+    run_docker should probe EC2 and build the credential provider only once, but
+    freeze (and therefore refresh) the credentials on every call.
+    """
+    credentials = session_mock.return_value.get_credentials.return_value
+    credentials.get_frozen_credentials.side_effect = [
+        Mock(access_key="key1", secret_key="secret1", token="token1"),
+        Mock(access_key="key2", secret_key="secret2", token="token2"),
+    ]
+    is_ec2_instance.cache_clear()
+    get_aws_credentials.cache_clear()
+
+    try:
+        run_docker(["ls"], image="my-image", interactive=False)
+        assert check_output_mock.call_args[1]["env"]["AWS_ACCESS_KEY_ID"] == "key1"
+
+        run_docker(["ls"], image="my-image", interactive=False)
+        assert check_output_mock.call_args[1]["env"]["AWS_ACCESS_KEY_ID"] == "key2"
+    finally:
+        is_ec2_instance.cache_clear()
+        get_aws_credentials.cache_clear()
+
+    assert urlopen_mock.call_count == 1
+    assert session_mock.call_count == 1
+    assert credentials.get_frozen_credentials.call_count == 2
+
+
 def mock_executor(scheduler, debug=False, code_package=False):
     """
     Returns an AWSBatchExecutor with AWS API mocks.
@@ -584,6 +800,43 @@ def mock_executor(scheduler, debug=False, code_package=False):
     return executor
 
 
+@task()
+def task_no_args():
+    return 10
+
+
+@mock_s3
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_shared_empty_input(batch_submit_mock) -> None:
+    """
+    Jobs without arguments should share a single uploaded input file.
+    """
+    batch_submit_mock.return_value = {"jobId": "batch-job-id"}
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+
+    input_paths = []
+    for eval_hash in ["eval_hash1", "eval_hash2"]:
+        job = Job(task_no_args())
+        job.task = task_no_args
+        job.eval_hash = eval_hash
+        executor._submit_single_job(job, (), {})
+
+        command = batch_submit_mock.call_args[0][0]
+        input_paths.append(command[command.index("--input") + 1])
+        assert not File(get_job_scratch_file(executor.s3_scratch_prefix, job, "input")).exists()
+
+    assert input_paths == ["s3://example-bucket/redun/inputs/empty"] * 2
+    assert pickle.loads(cast(bytes, File(input_paths[0]).read("rb"))) == [(), {}]
+
+    # Jobs with arguments still get their own input file.
+    job = Job(task1(10))
+    job.task = task1
+    job.eval_hash = "eval_hash3"
+    executor._submit_single_job(job, (10,), {})
+    assert File(get_job_scratch_file(executor.s3_scratch_prefix, job, "input")).exists()
+
+
 @mock_s3
 @patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
 @patch("redun.executors.aws_batch.parse_task_logs")
@@ -705,6 +958,219 @@ def test_executor(
     job.job_tags == [("aws_batch_job", "batch-job2-id"), ("aws_log_stream", "log2")]
 
 
+@mock_s3
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+def test_monitor_backoff(iter_batch_job_status_mock) -> None:
+    """
+    Monitor polling should back off while idle and reset when jobs finish or are submitted.
+    """
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.interval = 1.0
+    executor.max_interval = 4.0
+    executor.is_running = True
+
+    jobs = {}
+    for name in ["a", "b", "c"]:
+        job = Job(task1(name))
+        job.task = task1
+        job.eval_hash = f"eval_hash_{name}"
+        jobs[name] = job
+    File(get_job_scratch_file(executor.s3_scratch_prefix, jobs["a"], "output")).write(
+        pickle_dumps("done"), mode="wb"
+    )
+    executor.pending_batch_jobs = {"a": jobs["a"], "b": jobs["b"]}
+
+    succeeded = set()
+    iter_batch_job_status_mock.side_effect = lambda job_ids, **kwargs: iter(
+        [
+            {"jobId": job_id, "status": SUCCEEDED if job_id in succeeded else "RUNNING"}
+            for job_id in job_ids
+        ]
+    )
+
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) == 5:
+            # Job a finishes.
+            succeeded.add("a")
+        elif len(sleeps) == 7:
+            # A new job is submitted.
+            executor.pending_batch_jobs["c"] = jobs["c"]
+        elif len(sleeps) == 9:
+            executor.is_running = False
+
+    with patch("redun.executors.aws_batch.time.sleep", side_effect=sleep):
+        executor._monitor()
+
+    assert sleeps == [1.0, 1.5, 2.25, 3.375, 4.0, 1.0, 1.5, 1.0, 1.5]
+    assert scheduler.job_results == {jobs["a"].id: "done"}
+
+
+@mock_s3
+@patch("redun.executors.aws_batch.aws_describe_jobs")
+def test_monitor_chunk_sleep(aws_describe_jobs_mock) -> None:
+    """
+    Monitor should sleep between chunks before describing the next chunk of jobs.
+    """
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.interval = 1.0
+    executor.is_running = True
+
+    for i in range(150):
+        job = Job(task1(i))
+        job.task = task1
+        executor.pending_batch_jobs[f"batch-job{i}"] = job
+
+    events = []
+
+    def aws_describe_jobs(job_ids, **kwargs):
+        for i in range(0, len(job_ids), 100):
+            events.append("describe")
+            yield from ({"jobId": job_id, "status": "RUNNING"} for job_id in job_ids[i : i + 100])
+
+    def sleep(interval):
+        events.append("sleep")
+        if events.count("sleep") == 2:
+            executor.is_running = False
+
+    aws_describe_jobs_mock.side_effect = aws_describe_jobs
+    with patch("redun.executors.aws_batch.time.sleep", side_effect=sleep):
+        executor._monitor()
+
+    assert events == ["describe", "sleep", "describe", "sleep"]
+
+
+@mock_s3
+@patch("redun.executors.aws_batch.aws_describe_jobs")
+def test_monitor_backoff_submit_between_chunks(aws_describe_jobs_mock) -> None:
+    """
+    Monitor polling should reset when jobs are submitted while sleeping between chunks.
+    """
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.interval = 1.0
+    executor.max_interval = 4.0
+    executor.is_running = True
+
+    jobs = []
+    for i in range(151):
+        job = Job(task1(i))
+        job.task = task1
+        jobs.append(job)
+    for i, job in enumerate(jobs[:150]):
+        executor.pending_batch_jobs[f"batch-job{i}"] = job
+
+    aws_describe_jobs_mock.side_effect = lambda job_ids, **kwargs: iter(
+        [{"jobId": job_id, "status": "RUNNING"} for job_id in job_ids]
+    )
+
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) == 5:
+            # A new job is submitted between the two chunks of the third sweep.
+            executor.pending_batch_jobs["batch-job150"] = jobs[150]
+        elif len(sleeps) == 8:
+            executor.is_running = False
+
+    with patch("redun.executors.aws_batch.time.sleep", side_effect=sleep):
+        executor._monitor()
+
+    # Each sweep sleeps once between its two chunks and then once with backoff.
+    assert sleeps == [1.0, 1.0, 1.0, 1.5, 1.0, 1.0, 1.0, 1.5]
+
+
+@mock_s3
+@patch("redun.executors.aws_batch.parse_task_logs")
+def test_executor_process_job_statuses(parse_task_logs_mock) -> None:
+    """
+    Outputs and errors of a batch of finished jobs should be fetched and reported in order.
+    """
+    parse_task_logs_mock.side_effect = lambda job_id, **kwargs: [f"log {job_id}\n"]
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+
+    jobs = []
+    for i in range(5):
+        job = Job(task1(i))
+        job.task = task1
+        job.eval_hash = f"eval_hash{i}"
+        executor.pending_batch_jobs[f"batch-job{i}"] = job
+        jobs.append(job)
+
+    # The last job succeeded without leaving an output.
+    for job in jobs[:2]:
+        output_file = File(get_job_scratch_file(executor.s3_scratch_prefix, job, "output"))
+        output_file.write(pickle_dumps(job.eval_hash), mode="wb")
+
+    # The last two jobs failed.
+    for job in jobs[3:]:
+        error = ValueError(job.eval_hash)
+        error_file = File(get_job_scratch_file(executor.s3_scratch_prefix, job, "error"))
+        error_file.write(pickle_dumps((error, Traceback.from_error(error))), mode="wb")
+
+    num_finished = executor._process_job_statuses(
+        [{"jobId": f"batch-job{i}", "status": SUCCEEDED} for i in range(3)]
+        + [{"jobId": f"batch-job{i}", "status": FAILED} for i in range(3, 5)]
+        + [{"jobId": "batch-job-other", "status": "RUNNING"}]
+    )
+    assert num_finished == 5
+
+    assert scheduler.job_results == {jobs[0].id: "eval_hash0", jobs[1].id: "eval_hash1"}
+    assert isinstance(scheduler.job_errors[jobs[2].id], FileNotFoundError)
+    for i in range(3, 5):
+        assert str(scheduler.job_errors[jobs[i].id]) == f"eval_hash{i}"
+    assert executor.pending_batch_jobs == {}
+    assert parse_task_logs_mock.call_count == 2
+
+
+@mock_s3
+@patch("redun.executors.aws_batch.parse_task_logs")
+def test_executor_job_failures_log_limit(parse_task_logs_mock) -> None:
+    """
+    Failed jobs should fetch their CloudWatch logs with limited concurrency.
+    """
+    lock = threading.Lock()
+    num_active = 0
+    max_active = 0
+
+    def parse_task_logs(job_id, **kwargs):
+        nonlocal num_active, max_active
+        with lock:
+            num_active += 1
+            max_active = max(max_active, num_active)
+        time.sleep(0.01)
+        with lock:
+            num_active -= 1
+        return [f"log {job_id}\n"]
+
+    parse_task_logs_mock.side_effect = parse_task_logs
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+
+    batch_jobs = []
+    for i in range(20):
+        job = Job(task1(i))
+        job.task = task1
+        job.eval_hash = f"eval_hash{i}"
+        executor.pending_batch_jobs[f"batch-job{i}"] = job
+        batch_jobs.append({"jobId": f"batch-job{i}", "status": FAILED})
+
+    try:
+        failures = executor._get_job_failures(batch_jobs)
+    finally:
+        executor.stop()
+
+    assert len(failures) == 20
+    assert parse_task_logs_mock.call_count == 20
+    assert 1 < max_active <= MAX_CONCURRENT_LOG_FETCHES
+
+
 @mock_s3
 @patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
 @patch("redun.executors.aws_batch.parse_task_logs")
@@ -1205,6 +1671,52 @@ def test_executor_inflight_job(
     executor.stop()
 
 
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_batch.aws_describe_jobs")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_inflight_jobs_described_together(
+    batch_submit_mock,
+    iter_batch_job_status_mock,
+    aws_describe_jobs_mock,
+    get_aws_user_mock,
+) -> None:
+    """
+    Preexisting jobs should be checked with one describe_jobs call, not one per job.
+    """
+    iter_batch_job_status_mock.return_value = iter([])
+    aws_describe_jobs_mock.return_value = iter([{"jobId": "111"}])
+    batch_submit_mock.return_value = {"jobId": "batch-job-id"}
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.get_jobs.return_value = [
+        {"jobId": "111", "jobName": "redun-job-eval_hash1"},
+        {"jobId": "222", "jobName": "redun-job-eval_hash2"},
+    ]
+
+    job1 = Job(task1(10))
+    job1.task = task1
+    job1.eval_hash = "eval_hash1"
+    job2 = Job(task1(20))
+    job2.task = task1
+    job2.eval_hash = "eval_hash2"
+
+    executor.submit(job1, [10], {})
+    executor.submit(job2, [20], {})
+
+    assert aws_describe_jobs_mock.call_count == 1
+    assert sorted(aws_describe_jobs_mock.call_args[0][0]) == ["111", "222"]
+
+    # Only the job still known to AWS Batch is reunited. The other is resubmitted.
+    assert executor.pending_batch_jobs["111"] == job1
+    wait_until(lambda: executor.arrayer.num_pending == 0)
+    assert executor.pending_batch_jobs["batch-job-id"] == job2
+
+    executor.stop()
+
+
 @use_tempdir
 def test_find_code_files():
     # Creating python files.
@@ -1416,6 +1928,60 @@ def test_arrayer_thread():
     arr.stop()
 
 
+@mock_s3
+@pytest.mark.parametrize("debug", [False, True])
+def test_arrayer_single_job_fanout(debug):
+    """
+    Jobs too few to array should be submitted individually, concurrently unless debugging.
+    """
+    sched = mock_scheduler()
+    exec = mock_executor(sched, debug=debug)
+    arr = job_array.JobArrayer(exec, submit_interval=10000.0, stale_time=10000.0, min_array_size=5)
+
+    jobs = []
+    for i in range(4):
+        job = Job(array_task(i))
+        job.task = array_task
+        jobs.append(job)
+        arr.add_job(job, args=(i,), kwargs={})
+
+    # Record which submissions overlap in time.
+    lock = threading.Lock()
+    running = []
+    overlaps = []
+    submitted = []
+    # Jobs after the first one wait for each other, so they only finish if concurrent.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def submit_single_job(job, args, kwargs, task_options):
+        with lock:
+            overlaps.append(list(running))
+            running.append(args[0])
+        if not debug and args[0] > 0:
+            barrier.wait()
+        else:
+            time.sleep(0.05)
+        with lock:
+            running.remove(args[0])
+            submitted.append(args[0])
+
+    with patch.object(exec, "_submit_single_job", side_effect=submit_single_job):
+        arr.submit_pending_jobs(job_array.JobDescription(jobs[0]))
+    arr.stop()
+    exec.stop()
+
+    assert arr.num_pending == 0
+    assert sorted(submitted) == [0, 1, 2, 3]
+    # The first job is submitted alone, so it can create the job definition.
+    assert submitted[0] == 0
+    assert overlaps[0] == []
+    if debug:
+        # Interactive Docker containers must not run at the same time.
+        assert overlaps == [[], [], [], []]
+    else:
+        assert any(overlaps[1:])
+
+
 @mock_s3
 @patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
 @patch("redun.executors.aws_batch.aws_describe_jobs")
@@ -1515,7 +2081,12 @@ def test_array_disabling(submit_single_mock, get_aws_user_mock):
 
     # Job should be submitted immediately.
     assert submit_single_mock.call_args
-    assert submit_single_mock.call_args[0] == (job, [5, 3], {})
+    assert submit_single_mock.call_args[0][:3] == (job, [5, 3], {})
+
+    # Job options computed at submission should be passed along, including the AWS user.
+    task_options = submit_single_mock.call_args[0][3]
+    assert task_options["batch_tags"]["redun_job_id"] == "carrots"
+    assert task_options["batch_tags"]["redun_aws_user"] == "alice"
 
     # Monitor thread should not run.
     assert not executor.arrayer._monitor_thread.is_alive()